@@ -93,13 +93,13 @@ async def revoke_token(current_user: Dict[str, Any] = Depends(get_current_user))
     
     # Verificar el token
     try:
-        payload = verify_token(token)
+        payload = await verify_token(token)
     except HTTPException:
         # Si el token ya es inválido, considerarlo como revocado
         return {"message": "Token ya revocado"}
     
     # Agregar a la lista negra
-    if blacklist_token(token):
+    if await blacklist_token(token):
         LogManager.log_info("auth", f"Token revocado correctamente para {payload.get('sub', 'unknown')}")
         return {"message": "Token revocado correctamente"}
     else:
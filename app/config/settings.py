@@ -90,6 +90,13 @@ class Settings(BaseSettings):
     # Caché
     CACHE_TTL: int = Field(default=300, env="CACHE_TTL")  # 5 minutos
     CACHE_PREFIX: str = Field(default="mcp:", env="CACHE_PREFIX")
+    CACHE_JSON_FALLBACK: bool = Field(default=True, env="CACHE_JSON_FALLBACK")  # Leer claves antiguas con json
+    CACHE_CLIENT_TRACKING: bool = Field(default=False, env="CACHE_CLIENT_TRACKING")  # Requiere Redis >= 6
+    CACHE_LOCAL_MAX_SIZE: int = Field(default=1024, env="CACHE_LOCAL_MAX_SIZE")
+    CACHE_LOCAL_PREFIXES: List[str] = Field(
+        default=["mcp:status", "blacklist:"],
+        env="CACHE_LOCAL_PREFIXES"
+    )
     
     # Plugins
     PLUGINS_ENABLED: bool = Field(default=True, env="PLUGINS_ENABLED")
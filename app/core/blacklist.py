@@ -42,20 +42,20 @@ class TokenBlacklist:
 
         async with self._cleanup_lock:
             try:
-                # Obtener todas las claves de blacklist
-                keys = await self._cache.scan_iter(match=f"{self._prefix}*")
-                
-                # Procesar en lotes
-                for i in range(0, len(keys), self._batch_size):
-                    batch = keys[i:i + self._batch_size]
+                # Recorrer las claves de blacklist por lotes, sin acumularlas
+                processed = 0
+                async for batch in self._cache.scan_iter(
+                    match=f"{self._prefix}*", count=self._batch_size
+                ):
                     # Verificar TTL de cada clave en el lote
                     for key in batch:
                         ttl = await self._cache.get_ttl(key)
                         if ttl is None or ttl <= 0:
                             await self._cache.delete(key)
+                    processed += len(batch)
                 
                 self._last_cleanup = current_time
-                logger.info(f"Limpieza de blacklist completada: {len(keys)} tokens procesados")
+                logger.info(f"Limpieza de blacklist completada: {processed} tokens procesados")
             except Exception as e:
                 logger.error(f"Error durante la limpieza de blacklist: {str(e)}")
                 raise
@@ -6,15 +6,21 @@ utilizando Redis como backend.
 """
 
 import json
+import time
+import asyncio
+import hashlib
+import inspect
 import logging
-from typing import Any, Optional, Dict, List, Union
+from typing import Any, Optional, Dict, List, Union, Callable, Tuple, AsyncIterator
 from datetime import datetime, timedelta
-import redis
+import orjson
+from redis import asyncio as aioredis
 from redis.exceptions import RedisError
 from backoff import on_exception, expo
 from app.config.settings import settings
-from redis.connection import ConnectionPool
-from functools import lru_cache
+from redis.asyncio.connection import ConnectionPool, SSLConnection
+from functools import wraps
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
@@ -30,48 +36,288 @@ class CacheOperationError(CacheError):
     """Error en operaciones de caché."""
     pass
 
+def _default_serializer(obj: Any) -> Any:
+    """
+    Convierte tipos no soportados nativamente por orjson.
+    
+    Args:
+        obj: Objeto a convertir
+        
+    Returns:
+        Representación serializable del objeto
+        
+    Raises:
+        TypeError: Si el tipo no es serializable
+    """
+    if isinstance(obj, (set, frozenset)):
+        # El orden de iteración de un set depende de la semilla de hash del
+        # proceso; se ordena por su serialización para que sea estable
+        return sorted(obj, key=lambda item: orjson.dumps(item, default=_default_serializer))
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Tipo no serializable: {type(obj).__name__}")
+
+def generate_key(namespace: str, data: Any) -> str:
+    """
+    Genera una clave de caché estable a partir de datos arbitrarios.
+    
+    El hash solo identifica la clave (no tiene requisitos criptográficos), por
+    lo que se usa BLAKE2b de 128 bits sobre la serialización orjson ordenada.
+    
+    Args:
+        namespace: Prefijo de la clave (por ejemplo "claude:response")
+        data: Datos que identifican la entrada
+        
+    Returns:
+        Clave de caché con formato "<namespace>:<hash>"
+    """
+    payload = orjson.dumps(
+        data,
+        default=_default_serializer,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return f"{namespace}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+# Devuelve el valor existente o almacena el nuevo en una sola operación atómica
+_GET_OR_SET_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    return value
+end
+if tonumber(ARGV[2]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return ARGV[1]
+"""
+
+# Almacena todos los pares clave/valor con el mismo TTL en una sola llamada
+_SET_MANY_SCRIPT = """
+local ttl = ARGV[1]
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, ARGV[i + 1], 'EX', ttl)
+end
+return #KEYS
+"""
+
+# Tamaño de lote para SCAN/UNLINK
+_SCAN_BATCH_SIZE = 500
+
+# Canal por el que Redis publica las invalidaciones de client tracking (RESP2)
+_INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+# Segundos antes de reintentar el client tracking tras un fallo al activarlo
+_TRACKING_RETRY_INTERVAL = 30.0
+
+# Marca de ausencia en el caché local (la clave no existe en Redis)
+_MISSING = object()
+
+# Pool de conexiones compartido por todos los clientes del proceso
+_connection_pool: Optional[ConnectionPool] = None
+
+def get_connection_pool() -> ConnectionPool:
+    """
+    Obtiene el pool de conexiones compartido, creándolo si no existe.
+    
+    Reutilizar conexiones ya autenticadas evita repetir el handshake
+    TCP/TLS y AUTH por cada cliente.
+    
+    Returns:
+        Pool de conexiones a Redis
+    """
+    global _connection_pool
+    if _connection_pool is None:
+        connection_kwargs = {
+            'host': settings.REDIS_HOST,
+            'port': settings.REDIS_PORT,
+            'password': settings.REDIS_PASSWORD,
+            'db': settings.REDIS_DB,
+            'socket_timeout': settings.REDIS_TIMEOUT,
+            'socket_connect_timeout': settings.REDIS_TIMEOUT,
+            'max_connections': settings.REDIS_MAX_CONNECTIONS,
+            'retry_on_timeout': True,
+            'decode_responses': True
+        }
+        
+        if settings.REDIS_SSL:
+            connection_kwargs['connection_class'] = SSLConnection
+        
+        _connection_pool = ConnectionPool(**connection_kwargs)
+    return _connection_pool
+
 class Cache:
     """Clase para manejo de caché con Redis."""
     
-    def __init__(self):
-        """Inicializa el cliente de Redis con configuración optimizada."""
-        try:
-            # Configurar pool de conexiones
-            connection_kwargs = {
-                'host': settings.REDIS_HOST,
-                'port': settings.REDIS_PORT,
-                'password': settings.REDIS_PASSWORD,
-                'db': settings.REDIS_DB,
-                'socket_timeout': settings.REDIS_TIMEOUT,
-                'socket_connect_timeout': settings.REDIS_TIMEOUT,
-                'max_connections': settings.REDIS_MAX_CONNECTIONS,
-                'retry_on_timeout': True,
-                'decode_responses': True
-            }
-            
-            if settings.REDIS_SSL:
-                connection_kwargs['ssl'] = True
-            
-            self.pool = ConnectionPool(**connection_kwargs)
-            
-            self.redis = redis.Redis(connection_pool=self.pool)
-            self.prefix = settings.CACHE_PREFIX
-            self.default_ttl = settings.CACHE_TTL
-            self._test_connection()
-        except RedisError as e:
-            logger.error(f"Error al inicializar Redis: {str(e)}")
-            raise CacheConnectionError(f"Error de conexión con Redis: {str(e)}")
+    def __init__(self, client: Optional[aioredis.Redis] = None):
+        """
+        Inicializa el cliente de Redis con configuración optimizada.
+        
+        Args:
+            client: Cliente de Redis a usar (opcional); por defecto se crea uno
+                sobre el pool de conexiones compartido
+        """
+        # Redis no se contacta aquí: la conexión se abre en la primera
+        # operación y ping() permite comprobarla explícitamente
+        self.redis = client or aioredis.Redis(connection_pool=get_connection_pool())
+        self.pool = self.redis.connection_pool
+        self.prefix = settings.CACHE_PREFIX
+        self.default_ttl = settings.CACHE_TTL
+        self._json_fallback = settings.CACHE_JSON_FALLBACK
+        
+        # Scripts Lua registrados; se ejecutan vía EVALSHA
+        self._get_or_set_script = self.redis.register_script(_GET_OR_SET_SCRIPT)
+        self._set_many_script = self.redis.register_script(_SET_MANY_SCRIPT)
+        
+        # Caché local invalidado por Redis (client tracking) para claves de
+        # lectura frecuente; solo se usa mientras el listener está activo
+        self._tracking_enabled = settings.CACHE_CLIENT_TRACKING
+        self._local_prefixes = tuple(
+            f"{self.prefix}{prefix}" for prefix in settings.CACHE_LOCAL_PREFIXES
+        )
+        self._local_max_size = settings.CACHE_LOCAL_MAX_SIZE
+        self._local: "OrderedDict[str, Any]" = OrderedDict()
+        self._local_generation = 0
+        self._tracking_task: Optional[asyncio.Task] = None
+        self._tracking_retry_at = 0.0
+        self._tracking_lock = asyncio.Lock()
     
-    def _test_connection(self) -> None:
-        """Prueba la conexión con Redis."""
+    async def ping(self) -> bool:
+        """
+        Prueba la conexión con Redis.
+        
+        Returns:
+            True si Redis responde
+            
+        Raises:
+            CacheConnectionError: Si no es posible conectar
+        """
         try:
-            self.redis.ping()
+            return bool(await self.redis.ping())
         except RedisError as e:
             logger.error(f"Error al probar conexión con Redis: {str(e)}")
             raise CacheConnectionError(f"Error de conexión con Redis: {str(e)}")
     
+    async def _ensure_tracking(self) -> bool:
+        """
+        Activa el client tracking de Redis si está habilitado.
+        
+        Una conexión dedicada se suscribe al canal de invalidaciones y otra
+        activa el tracking en modo BCAST para los prefijos locales, de modo
+        que Redis notifica cualquier escritura sobre ellos sin importar qué
+        conexión del pool leyó la clave.
+        
+        Returns:
+            True si el caché local puede usarse
+        """
+        if not self._tracking_enabled or not self._local_prefixes:
+            return False
+        if self._tracking_task is not None and not self._tracking_task.done():
+            return True
+        # Tras un fallo (Redis < 6, sin permiso para CLIENT) no reintentar en cada lectura
+        if time.monotonic() < self._tracking_retry_at:
+            return False
+        
+        async with self._tracking_lock:
+            if self._tracking_task is not None and not self._tracking_task.done():
+                return True
+            if time.monotonic() < self._tracking_retry_at:
+                return False
+            
+            # El listener espera invalidaciones indefinidamente: sin socket_timeout
+            listener = self._tracking_connection(socket_timeout=None)
+            tracker = self._tracking_connection()
+            try:
+                await listener.connect()
+                await listener.send_command("CLIENT", "ID")
+                client_id = await listener.read_response()
+                await listener.send_command("SUBSCRIBE", _INVALIDATE_CHANNEL)
+                await listener.read_response()
+                
+                prefixes = [arg for prefix in self._local_prefixes for arg in ("PREFIX", prefix)]
+                await tracker.connect()
+                await tracker.send_command(
+                    "CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", *prefixes
+                )
+                await tracker.read_response()
+            except (RedisError, OSError) as e:
+                await listener.disconnect()
+                await tracker.disconnect()
+                self._tracking_retry_at = time.monotonic() + _TRACKING_RETRY_INTERVAL
+                logger.warning(f"No se pudo activar el client tracking de Redis: {str(e)}")
+                return False
+            
+            self._local.clear()
+            self._tracking_task = asyncio.get_running_loop().create_task(
+                self._invalidation_loop(listener, tracker)
+            )
+            return True
+    
+    def _tracking_connection(self, **overrides: Any) -> Any:
+        """Crea una conexión dedicada, fuera del pool, para el client tracking."""
+        return self.pool.connection_class(**{**self.pool.connection_kwargs, **overrides})
+    
+    async def _invalidation_loop(self, listener: Any, tracker: Any) -> None:
+        """
+        Elimina del caché local las claves invalidadas por Redis.
+        
+        Si la conexión se pierde, el caché local se vacía y el tracking se
+        reactiva en la siguiente lectura.
+        """
+        try:
+            while True:
+                message = await listener.read_response()
+                if not isinstance(message, list) or len(message) < 3:
+                    continue
+                self._local_generation += 1
+                keys = message[2]
+                if keys is None:
+                    # FLUSHDB/FLUSHALL: Redis no indica claves concretas
+                    self._local.clear()
+                else:
+                    for key in keys if isinstance(keys, list) else [keys]:
+                        self._local.pop(key, None)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Listener de invalidaciones de Redis detenido: {str(e)}")
+        finally:
+            self._local_generation += 1
+            self._local.clear()
+            await listener.disconnect()
+            await tracker.disconnect()
+    
+    def _forget(self, *full_keys: str) -> None:
+        """Descarta claves del caché local tras una escritura propia."""
+        if self._local:
+            for full_key in full_keys:
+                self._local.pop(full_key, None)
+    
+    def _dumps(self, value: Any) -> bytes:
+        """
+        Serializa un valor con orjson.
+        
+        Las claves de diccionario que no son str se convierten a str, igual
+        que hacía json.dumps.
+        """
+        return orjson.dumps(value, default=_default_serializer, option=orjson.OPT_NON_STR_KEYS)
+    
+    def _loads(self, raw: Union[str, bytes]) -> Any:
+        """
+        Deserializa un valor almacenado.
+        
+        Las claves escritas con json estándar que orjson no acepta (por ejemplo
+        NaN) se leen con json si CACHE_JSON_FALLBACK está habilitado.
+        """
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            if not self._json_fallback:
+                raise
+            return json.loads(raw)
+    
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """
         Obtiene un valor del caché.
         
@@ -86,16 +332,29 @@ class Cache:
         """
         try:
             full_key = f"{self.prefix}{key}"
-            value = self.redis.get(full_key)
-            if value:
-                return json.loads(value)
-            return None
+            local = full_key.startswith(self._local_prefixes) and await self._ensure_tracking()
+            if local:
+                value = self._local.get(full_key, _MISSING)
+                if value is not _MISSING:
+                    self._local.move_to_end(full_key)
+                    return value
+                generation = self._local_generation
+            
+            value = await self.redis.get(full_key)
+            value = self._loads(value) if value else None
+            
+            # Si llegó una invalidación durante la lectura el valor puede estar obsoleto
+            if local and generation == self._local_generation:
+                self._local[full_key] = value
+                if len(self._local) > self._local_max_size:
+                    self._local.popitem(last=False)
+            return value
         except (RedisError, json.JSONDecodeError) as e:
             logger.error(f"Error al obtener valor de caché: {str(e)}")
             raise CacheOperationError(f"Error al obtener valor de caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
         Almacena un valor en el caché.
         
@@ -112,18 +371,48 @@ class Cache:
         """
         try:
             full_key = f"{self.prefix}{key}"
-            serialized = json.dumps(value)
-            return self.redis.set(
+            serialized = self._dumps(value)
+            stored = await self.redis.set(
                 full_key,
                 serialized,
                 ex=ttl or self.default_ttl
             )
+            self._forget(full_key)
+            return stored
         except (RedisError, TypeError) as e:
             logger.error(f"Error al almacenar en caché: {str(e)}")
             raise CacheOperationError(f"Error al almacenar en caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def delete(self, key: str) -> bool:
+    async def get_or_set(self, key: str, value: Any, ttl: Optional[int] = None) -> Any:
+        """
+        Obtiene un valor del caché o almacena el proporcionado si no existe.
+        
+        Args:
+            key: Clave a buscar
+            value: Valor a almacenar si la clave no existe
+            ttl: Tiempo de vida en segundos (opcional)
+            
+        Returns:
+            Valor existente o el valor recién almacenado
+            
+        Raises:
+            CacheOperationError: Si hay un error en la operación
+        """
+        try:
+            full_key = f"{self.prefix}{key}"
+            stored = await self._get_or_set_script(
+                keys=[full_key],
+                args=[self._dumps(value), ttl or self.default_ttl or 0]
+            )
+            self._forget(full_key)
+            return self._loads(stored)
+        except (RedisError, TypeError, json.JSONDecodeError) as e:
+            logger.error(f"Error al obtener o almacenar en caché: {str(e)}")
+            raise CacheOperationError(f"Error al obtener o almacenar en caché: {str(e)}")
+    
+    @on_exception(expo, RedisError, max_tries=3, max_time=5)
+    async def delete(self, key: str) -> bool:
         """
         Elimina un valor del caché.
         
@@ -138,13 +427,15 @@ class Cache:
         """
         try:
             full_key = f"{self.prefix}{key}"
-            return bool(self.redis.delete(full_key))
+            deleted = await self.redis.delete(full_key)
+            self._forget(full_key)
+            return bool(deleted)
         except RedisError as e:
             logger.error(f"Error al eliminar de caché: {str(e)}")
             raise CacheOperationError(f"Error al eliminar de caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def exists(self, key: str) -> bool:
+    async def exists(self, key: str) -> bool:
         """
         Verifica si existe una clave en el caché.
         
@@ -159,13 +450,13 @@ class Cache:
         """
         try:
             full_key = f"{self.prefix}{key}"
-            return bool(self.redis.exists(full_key))
+            return bool(await self.redis.exists(full_key))
         except RedisError as e:
             logger.error(f"Error al verificar existencia en caché: {str(e)}")
             raise CacheOperationError(f"Error al verificar existencia en caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def clear(self) -> bool:
+    async def clear(self) -> bool:
         """
         Limpia todo el caché.
         
@@ -176,17 +467,50 @@ class Cache:
             CacheOperationError: Si hay un error en la operación
         """
         try:
-            pattern = f"{self.prefix}*"
-            keys = self.redis.keys(pattern)
-            if keys:
-                return bool(self.redis.delete(*keys))
+            # SCAN incremental + UNLINK por lote: no bloquea el servidor como KEYS
+            # y la memoria usada se limita a un lote
+            async for batch in self._scan_batches(f"{self.prefix}*", _SCAN_BATCH_SIZE):
+                await self.redis.unlink(*batch)
+            self._local.clear()
             return True
         except RedisError as e:
             logger.error(f"Error al limpiar caché: {str(e)}")
             raise CacheOperationError(f"Error al limpiar caché: {str(e)}")
     
+    async def _scan_batches(self, pattern: str, count: int) -> AsyncIterator[List[str]]:
+        """Recorre con SCAN las claves completas que coinciden con el patrón, por lotes."""
+        cursor = 0
+        while True:
+            cursor, keys = await self.redis.scan(cursor, match=pattern, count=count)
+            if keys:
+                yield keys
+            if cursor == 0:
+                break
+    
+    async def scan_iter(self, match: str = "*", count: int = _SCAN_BATCH_SIZE) -> AsyncIterator[List[str]]:
+        """
+        Recorre las claves del caché por lotes sin acumularlas en memoria.
+        
+        Args:
+            match: Patrón de claves, relativo al prefijo del caché
+            count: Número aproximado de claves por lote
+            
+        Yields:
+            Lotes de claves (sin el prefijo del caché)
+            
+        Raises:
+            CacheOperationError: Si hay un error en la operación
+        """
+        prefix_length = len(self.prefix)
+        try:
+            async for batch in self._scan_batches(f"{self.prefix}{match}", count):
+                yield [key[prefix_length:] for key in batch]
+        except RedisError as e:
+            logger.error(f"Error al recorrer claves del caché: {str(e)}")
+            raise CacheOperationError(f"Error al recorrer claves del caché: {str(e)}")
+    
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
         """
         Obtiene múltiples valores del caché.
         
@@ -204,23 +528,26 @@ class Cache:
                 return {}
                 
             full_keys = [f"{self.prefix}{key}" for key in keys]
-            values = self.redis.mget(full_keys)
+            values = await self.redis.mget(full_keys)
             
-            result = {}
-            for key, value in zip(keys, values):
-                if value is not None:
+            found = {key: value for key, value in zip(keys, values) if value is not None}
+            try:
+                return dict(zip(found, map(self._loads, found.values())))
+            except json.JSONDecodeError:
+                # Omitir valores corruptos sin descartar el lote completo
+                result = {}
+                for key, value in found.items():
                     try:
-                        result[key] = json.loads(value)
+                        result[key] = self._loads(value)
                     except json.JSONDecodeError:
                         continue
-                        
-            return result
+                return result
         except RedisError as e:
             logger.error(f"Error al obtener múltiples valores de caché: {str(e)}")
             raise CacheOperationError(f"Error al obtener múltiples valores de caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    async def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
         """
         Almacena múltiples valores en el caché.
         
@@ -238,20 +565,26 @@ class Cache:
             if not mapping:
                 return True
                 
-            pipe = self.redis.pipeline()
-            for key, value in mapping.items():
-                full_key = f"{self.prefix}{key}"
-                serialized = json.dumps(value)
-                pipe.set(full_key, serialized, ex=ttl or self.default_ttl)
-                
-            results = pipe.execute()
-            return all(results)
+            expire = ttl or self.default_ttl
+            serialized = {f"{self.prefix}{key}": self._dumps(value) for key, value in mapping.items()}
+            self._forget(*serialized)
+            
+            # Sin expiración basta un único MSET
+            if not expire:
+                return bool(await self.redis.mset(serialized))
+            
+            # Un único EVALSHA con todos los pares: un RTT y TTL aplicado atómicamente
+            stored = await self._set_many_script(
+                keys=list(serialized),
+                args=[expire, *serialized.values()]
+            )
+            return stored == len(serialized)
         except (RedisError, TypeError) as e:
             logger.error(f"Error al almacenar múltiples valores en caché: {str(e)}")
             raise CacheOperationError(f"Error al almacenar múltiples valores en caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def delete_many(self, keys: List[str]) -> bool:
+    async def delete_many(self, keys: List[str]) -> bool:
         """
         Elimina múltiples valores del caché.
         
@@ -269,13 +602,15 @@ class Cache:
                 return True
                 
             full_keys = [f"{self.prefix}{key}" for key in keys]
-            return bool(self.redis.delete(*full_keys))
+            deleted = await self.redis.delete(*full_keys)
+            self._forget(*full_keys)
+            return bool(deleted)
         except RedisError as e:
             logger.error(f"Error al eliminar múltiples valores de caché: {str(e)}")
             raise CacheOperationError(f"Error al eliminar múltiples valores de caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def increment(self, key: str, amount: int = 1) -> int:
+    async def increment(self, key: str, amount: int = 1) -> int:
         """
         Incrementa un contador en el caché.
         
@@ -291,13 +626,15 @@ class Cache:
         """
         try:
             full_key = f"{self.prefix}{key}"
-            return self.redis.incrby(full_key, amount)
+            value = await self.redis.incrby(full_key, amount)
+            self._forget(full_key)
+            return value
         except RedisError as e:
             logger.error(f"Error al incrementar contador en caché: {str(e)}")
             raise CacheOperationError(f"Error al incrementar contador en caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def decrement(self, key: str, amount: int = 1) -> int:
+    async def decrement(self, key: str, amount: int = 1) -> int:
         """
         Decrementa un contador en el caché.
         
@@ -313,13 +650,15 @@ class Cache:
         """
         try:
             full_key = f"{self.prefix}{key}"
-            return self.redis.decrby(full_key, amount)
+            value = await self.redis.decrby(full_key, amount)
+            self._forget(full_key)
+            return value
         except RedisError as e:
             logger.error(f"Error al decrementar contador en caché: {str(e)}")
             raise CacheOperationError(f"Error al decrementar contador en caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def get_ttl(self, key: str) -> Optional[int]:
+    async def get_ttl(self, key: str) -> Optional[int]:
         """
         Obtiene el tiempo restante de vida de una clave.
         
@@ -334,14 +673,14 @@ class Cache:
         """
         try:
             full_key = f"{self.prefix}{key}"
-            ttl = self.redis.ttl(full_key)
+            ttl = await self.redis.ttl(full_key)
             return ttl if ttl > 0 else None
         except RedisError as e:
             logger.error(f"Error al obtener TTL de caché: {str(e)}")
             raise CacheOperationError(f"Error al obtener TTL de caché: {str(e)}")
     
     @on_exception(expo, RedisError, max_tries=3, max_time=5)
-    def touch(self, key: str, ttl: Optional[int] = None) -> bool:
+    async def touch(self, key: str, ttl: Optional[int] = None) -> bool:
         """
         Actualiza el tiempo de vida de una clave.
         
@@ -358,22 +697,149 @@ class Cache:
         try:
             full_key = f"{self.prefix}{key}"
             if ttl is not None:
-                return bool(self.redis.expire(full_key, ttl))
-            return bool(self.redis.expire(full_key, self.default_ttl))
+                return bool(await self.redis.expire(full_key, ttl))
+            return bool(await self.redis.expire(full_key, self.default_ttl))
         except RedisError as e:
             logger.error(f"Error al actualizar TTL en caché: {str(e)}")
             raise CacheOperationError(f"Error al actualizar TTL en caché: {str(e)}")
 
-# Instancia global de caché con decorador lru_cache para evitar múltiples instancias
-@lru_cache()
+# Instancia global de caché
+cache = Cache()
+
 def get_cache() -> Cache:
     """
-    Obtiene una instancia del caché.
+    Obtiene la instancia global del caché.
     
     Returns:
         Instancia de Cache
     """
-    return Cache()
+    return cache
 
-# Instancia global de caché
-cache = get_cache() 
\ No newline at end of file
+# Cargas en curso por clave para el decorador cached (evita thundering herd)
+_inflight: Dict[str, asyncio.Future] = {}
+
+def _build_key_function(
+    func: Callable,
+    namespace: str,
+    ignore_receiver: bool = False
+) -> Callable[[Tuple, Dict], str]:
+    """
+    Construye una función de clave especializada para la firma de `func`.
+    
+    La firma se inspecciona una sola vez: los argumentos por nombre se colocan
+    en su posición y se completan los valores por defecto, de modo que
+    f(1, b=2) y f(1, 2) comparten clave sin ordenar kwargs en cada llamada.
+    
+    Args:
+        func: Función decorada
+        namespace: Prefijo de las claves generadas
+        ignore_receiver: Excluir de la clave el primer parámetro (self/cls)
+        
+    Returns:
+        Función (args, kwargs) -> clave de caché
+    """
+    params = list(inspect.signature(func).parameters.values())
+    
+    skip = 1 if ignore_receiver and params and params[0].name in ("self", "cls") else 0
+    params = params[skip:]
+    
+    variadic = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    if any(param.kind in variadic for param in params):
+        def make_key(args: Tuple, kwargs: Dict) -> str:
+            return generate_key(namespace, [args[skip:], kwargs])
+        return make_key
+    
+    defaults = [param.default for param in params]
+    index = {param.name: position for position, param in enumerate(params)}
+    
+    def make_key(args: Tuple, kwargs: Dict) -> str:
+        values = [*args[skip:], *defaults[len(args) - skip:]]
+        for name, value in kwargs.items():
+            values[index[name]] = value
+        return generate_key(namespace, values)
+    
+    return make_key
+
+def cached(
+    ttl: Optional[int] = None,
+    namespace: Optional[str] = None,
+    ignore_receiver: bool = False
+):
+    """
+    Decorador que cachea en Redis el resultado de una corrutina.
+    
+    Todos los argumentos forman parte de la clave, incluido el receptor de un
+    método; si no es serializable la llamada se ejecuta sin caché.
+    
+    Args:
+        ttl: Tiempo de vida en segundos (opcional)
+        namespace: Prefijo de las claves (por defecto, módulo y nombre de la función)
+        ignore_receiver: Excluir self/cls de la clave; solo para métodos cuyo
+            resultado no depende del estado de la instancia
+        
+    Returns:
+        Decorador para funciones asíncronas
+    """
+    def decorator(func: Callable) -> Callable:
+        make_key = _build_key_function(
+            func,
+            namespace or f"cached:{func.__module__}.{func.__qualname__}",
+            ignore_receiver
+        )
+        
+        async def load(key: str, args: Tuple, kwargs: Dict) -> Any:
+            backend = get_cache()
+            try:
+                cached_result = await backend.get(key)
+                if cached_result is not None:
+                    return cached_result
+            except CacheError as e:
+                logger.warning(f"Caché no disponible para {func.__qualname__}: {str(e)}")
+            
+            result = await func(*args, **kwargs)
+            if result is not None:
+                try:
+                    await backend.set(key, result, ttl=ttl)
+                except CacheError as e:
+                    logger.warning(f"No se pudo cachear {func.__qualname__}: {str(e)}")
+            return result
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                key = make_key(args, kwargs)
+            except (TypeError, KeyError, IndexError):
+                # Argumentos no serializables o inválidos: ejecutar sin caché
+                return await func(*args, **kwargs)
+            
+            # Si ya hay una carga en curso para la clave, esperar su resultado
+            while (inflight := _inflight.get(key)) is not None:
+                try:
+                    return await asyncio.shield(inflight)
+                except asyncio.CancelledError:
+                    # Se canceló la llamada que cargaba, no esta: reintentar
+                    # la carga en lugar de propagar su cancelación
+                    if not inflight.cancelled():
+                        raise
+            
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+            try:
+                result = await load(key, args, kwargs)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # Marcar la excepción como consultada aunque no haya esperas
+                future.exception()
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                del _inflight[key]
+        
+        wrapper._cache_keyfn = make_key
+        return wrapper
+    return decorator
@@ -8,7 +8,10 @@ from functools import lru_cache
 import httpx
 from app.core.config import settings
 from app.core.logging import LogManager
-from app.core.cache import get_cache
+from app.core.cache import cached
+
+# Tiempo de vida de las respuestas cacheadas
+RESPONSE_CACHE_TTL = 3600  # 1 hora
 
 class ClaudeClient:
     """
@@ -33,8 +36,6 @@ class ClaudeClient:
         self.model = settings.CLAUDE_MODEL
         self.max_tokens = settings.CLAUDE_MAX_TOKENS
         self.temperature = settings.CLAUDE_TEMPERATURE
-        self._cache = get_cache()
-        self._cache_ttl = 3600  # 1 hora por defecto
     
     @backoff.on_exception(
         backoff.expo,
@@ -44,8 +45,7 @@ class ClaudeClient:
     )
     async def generate_response(self, prompt: str, max_tokens: Optional[int] = None, 
                               temperature: Optional[float] = None, 
-                              cache_enabled: bool = True, 
-                              cache_ttl: Optional[int] = None) -> Dict[str, Any]:
+                              cache_enabled: bool = True) -> Dict[str, Any]:
         """
         Genera una respuesta usando Claude API con soporte para caché y reintentos
         
@@ -54,7 +54,6 @@ class ClaudeClient:
             max_tokens: Número máximo de tokens (opcional)
             temperature: Temperatura para la generación (opcional)
             cache_enabled: Si se debe usar caché (opcional)
-            cache_ttl: Tiempo de vida del caché en segundos (opcional)
             
         Returns:
             Dict con la respuesta de Claude
@@ -65,25 +64,32 @@ class ClaudeClient:
         # Usar valores proporcionados o los predeterminados
         tokens = max_tokens or self.max_tokens
         temp = temperature or self.temperature
-        ttl = cache_ttl or self._cache_ttl
-        
-        # Generar clave de caché
-        cache_key = f"claude:response:{hash(prompt + str(tokens) + str(temp))}"
         
-        # Intentar obtener del caché si está habilitado
         if cache_enabled:
-            cached_response = await self._cache.get(cache_key)
-            if cached_response:
-                self.logger.info(f"Respuesta obtenida del caché para prompt: {prompt[:50]}...")
-                return cached_response
+            return await self._cached_completion(self.model, prompt, tokens, temp)
+        return await self._request_completion(self.model, prompt, tokens, temp)
+    
+    async def _request_completion(self, model: str, prompt: str, max_tokens: int,
+                                  temperature: float) -> Dict[str, Any]:
+        """
+        Solicita una respuesta a Claude API
         
+        Args:
+            model: Modelo de Claude
+            prompt: Prompt para Claude
+            max_tokens: Número máximo de tokens
+            temperature: Temperatura para la generación
+            
+        Returns:
+            Dict con la respuesta de Claude
+        """
         start_time = time.time()
         try:
             # Preparar datos para la petición
             data = {
-                "model": self.model,
-                "max_tokens": tokens,
-                "temperature": temp,
+                "model": model,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
                 "messages": [
                     {"role": "user", "content": prompt}
                 ]
@@ -103,14 +109,10 @@ class ClaudeClient:
             formatted_result = {
                 "content": result["content"][0]["text"],
                 "tokens_used": result["usage"]["total_tokens"],
-                "model": self.model,
+                "model": model,
                 "execution_time": response_time
             }
             
-            # Guardar en caché si está habilitado
-            if cache_enabled:
-                await self._cache.set(cache_key, formatted_result, ttl=ttl)
-            
             self.logger.info(f"Respuesta generada en {response_time:.2f}s usando {formatted_result['tokens_used']} tokens")
             return formatted_result
             
@@ -121,6 +123,15 @@ class ClaudeClient:
             # Cerrar el cliente HTTP
             self.http_client.close()
     
+    # Misma petición, cacheada en Redis; las llamadas concurrentes con los
+    # mismos argumentos comparten una única petición a la API. El modelo va
+    # en los argumentos, así que la instancia no necesita formar parte de la clave
+    _cached_completion = cached(
+        ttl=RESPONSE_CACHE_TTL,
+        namespace="claude:response",
+        ignore_receiver=True
+    )(_request_completion)
+    
     @backoff.on_exception(
         backoff.expo,
         Exception,
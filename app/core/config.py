@@ -33,6 +33,15 @@ class Settings:
     REDIS_TIMEOUT: int = int(os.getenv("REDIS_TIMEOUT", "5"))
     REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "10"))
     
+    # Configuración de rate limiting
+    RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW", "60"))
+    RATE_LIMIT_MAX_REQUESTS: int = int(os.getenv("RATE_LIMIT_MAX_REQUESTS", "100"))
+    
+    # Configuración de caché en memoria
+    CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))
+    CACHE_MAX_SIZE: int = int(os.getenv("CACHE_MAX_SIZE", "10000"))
+    CACHE_SWEEP_INTERVAL: int = int(os.getenv("CACHE_SWEEP_INTERVAL", "60"))
+    
     # Configuración de directorios
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
     LOG_DIR: Path = BASE_DIR / os.getenv("LOG_DIR", "logs")
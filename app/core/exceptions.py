@@ -94,6 +94,17 @@ class FileSystemError(MCPClaudeError):
     ):
         super().__init__(message, error_code, status_code, details)
 
+class CacheError(MCPClaudeError):
+    """Error en operaciones de caché en memoria"""
+    def __init__(
+        self, 
+        message: str, 
+        error_code: str = "CACHE_ERROR",
+        status_code: int = 500,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(message, error_code, status_code, details)
+
 class ValidationError(MCPClaudeError):
     """Error de validación"""
     def __init__(
@@ -6,6 +6,7 @@ from fastapi import Depends, HTTPException, status, Security
 from fastapi.security import OAuth2PasswordBearer, APIKeyHeader
 from app.core.config import settings
 from app.core.logging import LogManager
+from app.core.cache import cache
 import hashlib
 import time
 
@@ -57,7 +58,7 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     
     return encoded_jwt
 
-def verify_token(token: str) -> Dict[str, Any]:
+async def verify_token(token: str) -> Dict[str, Any]:
     """
     Verifica un token JWT y devuelve los datos decodificados.
     
@@ -72,7 +73,7 @@ def verify_token(token: str) -> Dict[str, Any]:
     """
     try:
         # Verificar si el token está en la lista negra
-        if is_token_blacklisted(token):
+        if await is_token_blacklisted(token):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token ha sido revocado",
@@ -156,7 +157,7 @@ async def validate_api_keys(request: Dict[str, Any]) -> bool:
     
     return True
 
-def is_token_blacklisted(token: str) -> bool:
+async def is_token_blacklisted(token: str) -> bool:
     """
     Verifica si un token está en la lista negra.
     
@@ -171,13 +172,12 @@ def is_token_blacklisted(token: str) -> bool:
         token_hash = hashlib.sha256(token.encode()).hexdigest()
         
         # Verificar en Redis si el token está en la lista negra
-        from app.core.cache import cache
-        return cache.get(f"blacklist:{token_hash}") is not None
+        return await cache.get(f"blacklist:{token_hash}") is not None
     except Exception as e:
         LogManager.log_error("security", f"Error al verificar lista negra: {str(e)}")
         return False
 
-def blacklist_token(token: str, expires_in: Optional[int] = None) -> bool:
+async def blacklist_token(token: str, expires_in: Optional[int] = None) -> bool:
     """
     Agrega un token a la lista negra.
     
@@ -210,8 +210,7 @@ def blacklist_token(token: str, expires_in: Optional[int] = None) -> bool:
             ttl = expires_in
             
         # Agregar a la lista negra en Redis
-        from app.core.cache import cache
-        return cache.set(f"blacklist:{token_hash}", True, expire=ttl)
+        return await cache.set(f"blacklist:{token_hash}", True, ttl=ttl)
     except Exception as e:
         LogManager.log_error("security", f"Error al agregar token a lista negra: {str(e)}")
         return False 
\ No newline at end of file
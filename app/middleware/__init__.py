@@ -1,44 +1,67 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request, HTTPException
+from fastapi.responses import JSONResponse
+from app.core.cache import CacheError
 from app.core.logging import LogManager
+from app.middleware.auth import verify_auth
+from app.middleware.rate_limit import rate_limiter
 import time
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        
-        # Log request
-        LogManager.log_api_request(
-            method=request.method,
-            path=request.url.path,
-            data=await request.json() if request.method in ["POST", "PUT"] else None
-        )
-        
-        # Process request
+logger = LogManager.get_logger("api")
+
+# Rutas de sondeo (load balancers) que no requieren auth, rate limit ni logging.
+# Se comparan sin la barra final: el router de health sirve "/health/" y el de
+# MCP "/mcp/status", montados en la raíz o bajo el prefijo /api
+_HEALTH_PATHS = frozenset({"/health", "/api/health", "/mcp/status", "/api/mcp/status"})
+
+# Rutas de documentación: sin autenticación ni rate limiting
+_PUBLIC_PATHS = frozenset({"/docs", "/redoc", "/openapi.json"})
+
+async def unified_middleware(request: Request, call_next):
+    """
+    Middleware HTTP único: autenticación, rate limiting, logging y errores.
+    
+    Agrupa en un solo frame lo que antes eran capas independientes, con una
+    única llamada a call_next y un único try/except por solicitud.
+    
+    Args:
+        request: Solicitud HTTP
+        call_next: Función para llamar al siguiente middleware
+    
+    Returns:
+        Respuesta HTTP
+    """
+    path = request.url.path.rstrip("/") or "/"
+    if path in _HEALTH_PATHS:
+        return await call_next(request)
+    
+    start_time = time.perf_counter()
+    try:
+        # Autenticación y rate limiting antes de procesar la solicitud
+        if path not in _PUBLIC_PATHS:
+            await verify_auth(request)
+            try:
+                await rate_limiter.check_rate_limit(request)
+            except CacheError as e:
+                # Sin Redis no se bloquean las solicitudes
+                logger.warning(f"Rate limiting no disponible: {str(e)}")
+    
         response = await call_next(request)
-        
-        # Calculate response time
-        response_time = time.time() - start_time
-        
-        # Log response
-        LogManager.log_api_response(
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            response_time=response_time
+    except HTTPException as e:
+        # Los middlewares no pasan por los exception handlers de FastAPI
+        response = JSONResponse(
+            status_code=e.status_code,
+            content={"detail": e.detail},
+            headers=e.headers
         )
-        
-        return response
-
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        try:
-            response = await call_next(request)
-            return response
-        except Exception as e:
-            LogManager.log_error(
-                error_type=type(e).__name__,
-                error_message=str(e),
-                stack_trace=str(e.__traceback__)
-            )
-            raise 
\ No newline at end of file
+    except Exception as e:
+        logger.exception(f"Error no manejado en {request.method} {request.url.path}: {str(e)}")
+        response = JSONResponse(
+            status_code=500,
+            content={"detail": "Error interno del servidor"}
+        )
+    
+    logger.info(
+        f"{request.method} {request.url.path} - {response.status_code} - "
+        f"{time.perf_counter() - start_time:.3f}s"
+    )
+    return response
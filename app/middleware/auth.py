@@ -6,6 +6,7 @@ from typing import Optional
 from app.core.blacklist import blacklist
 
 security = HTTPBearer()
+logger = LogManager.get_logger("auth")
 
 async def verify_auth(request: Request) -> Optional[dict]:
     """
@@ -28,7 +29,7 @@ async def verify_auth(request: Request) -> Optional[dict]:
     auth_header = request.headers.get("Authorization")
     
     if not auth_header:
-        LogManager.log_warning("auth", "Solicitud sin encabezado de autorización")
+        logger.warning("Solicitud sin encabezado de autorización")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Se requiere autenticación",
@@ -38,7 +39,7 @@ async def verify_auth(request: Request) -> Optional[dict]:
     # Verificar el formato del encabezado
     parts = auth_header.split()
     if len(parts) != 2 or parts[0].lower() != "bearer":
-        LogManager.log_warning("auth", "Formato de autorización inválido")
+        logger.warning("Formato de autorización inválido")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Formato de autorización inválido",
@@ -55,19 +56,19 @@ async def verify_auth(request: Request) -> Optional[dict]:
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revocado")
             
             # Verificar token JWT
-            payload = verify_token(token)
-            LogManager.log_info("auth", f"Autenticación JWT exitosa para {payload.get('sub', 'unknown')}")
+            payload = await verify_token(token)
+            logger.info(f"Autenticación JWT exitosa para {payload.get('sub', 'unknown')}")
             return payload
         except HTTPException as e:
-            LogManager.log_error("auth", f"Error de autenticación JWT: {str(e)}")
+            logger.error(f"Error de autenticación JWT: {str(e)}")
             raise
     else:
         # Verificar API key
         if verify_api_key(token):
-            LogManager.log_info("auth", "Autenticación con API key exitosa")
+            logger.info("Autenticación con API key exitosa")
             return {"sub": "api_key", "type": "api_key"}
         else:
-            LogManager.log_warning("auth", "API key inválida")
+            logger.warning("API key inválida")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="API key inválida",
@@ -86,11 +87,11 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revocado")
             
         # Verificar y decodificar token
-        user = verify_token(token)
+        user = await verify_token(token)
         return user
         
     except HTTPException:
         raise
     except Exception as e:
-        LogManager.log_error("auth", f"Error al obtener usuario: {str(e)}")
+        logger.error(f"Error al obtener usuario: {str(e)}")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Error de autenticación") 
\ No newline at end of file
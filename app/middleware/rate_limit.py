@@ -6,6 +6,8 @@ import time
 import json
 from typing import Optional, Dict, Any
 
+logger = LogManager.get_logger("rate_limit")
+
 class RateLimiter:
     """
     Clase para manejar el rate limiting basado en IP
@@ -49,7 +51,7 @@ class RateLimiter:
         """
         return f"rate_limit:{ip}:{endpoint}"
     
-    def _get_current_window(self, ip: str, endpoint: str) -> Dict[str, Any]:
+    async def _get_current_window(self, ip: str, endpoint: str) -> Dict[str, Any]:
         """
         Obtiene la ventana actual de rate limiting
         
@@ -61,19 +63,18 @@ class RateLimiter:
             Datos de la ventana actual
         """
         cache_key = self._get_cache_key(ip, endpoint)
-        data = cache.get(cache_key)
         
-        if not data:
-            # Crear nueva ventana
-            data = {
+        # Obtener la ventana existente o crear una nueva en una sola operación
+        return await cache.get_or_set(
+            cache_key,
+            {
                 "count": 0,
                 "reset_time": int(time.time()) + self.window
-            }
-            cache.set(cache_key, data, expire=self.window)
-        
-        return data
+            },
+            ttl=self.window
+        )
     
-    def _update_window(self, ip: str, endpoint: str, data: Dict[str, Any]) -> None:
+    async def _update_window(self, ip: str, endpoint: str, data: Dict[str, Any]) -> None:
         """
         Actualiza la ventana de rate limiting
         
@@ -83,7 +84,7 @@ class RateLimiter:
             data: Datos de la ventana actual
         """
         cache_key = self._get_cache_key(ip, endpoint)
-        cache.set(cache_key, data, expire=self.window)
+        await cache.set(cache_key, data, ttl=self.window)
     
     async def check_rate_limit(self, request: Request) -> None:
         """
@@ -102,7 +103,7 @@ class RateLimiter:
         endpoint = request.url.path
         
         # Obtener la ventana actual
-        data = self._get_current_window(ip, endpoint)
+        data = await self._get_current_window(ip, endpoint)
         
         # Verificar si la ventana ha expirado
         current_time = int(time.time())
@@ -117,7 +118,7 @@ class RateLimiter:
         data["count"] += 1
         
         # Actualizar ventana
-        self._update_window(ip, endpoint, data)
+        await self._update_window(ip, endpoint, data)
         
         # Verificar si se ha excedido el límite
         if data["count"] > self.max_requests:
@@ -125,10 +126,7 @@ class RateLimiter:
             reset_time = data["reset_time"] - current_time
             
             # Registrar exceso
-            LogManager.log_warning(
-                "rate_limit", 
-                f"IP {ip} excedió el límite de tasa para {endpoint}"
-            )
+            logger.warning(f"IP {ip} excedió el límite de tasa para {endpoint}")
             
             # Lanzar excepción
             raise HTTPException(
@@ -147,24 +145,3 @@ class RateLimiter:
 
 # Instancia global del rate limiter
 rate_limiter = RateLimiter()
-
-async def rate_limit_middleware(request: Request, call_next):
-    """
-    Middleware para rate limiting
-    
-    Args:
-        request: Solicitud HTTP
-        call_next: Función para llamar al siguiente middleware
-        
-    Returns:
-        Respuesta HTTP
-    """
-    # Verificar si la ruta es pública
-    if request.url.path in ["/api/health", "/docs", "/redoc", "/openapi.json"]:
-        return await call_next(request)
-    
-    # Verificar rate limit
-    await rate_limiter.check_rate_limit(request)
-    
-    # Continuar con la solicitud
-    return await call_next(request) 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from enum import Enum
 
@@ -24,6 +24,8 @@ class MCPRequest(BaseModel):
     """
     Modelo de solicitud MCP
     """
+    model_config = ConfigDict(frozen=True)
+    
     jsonrpc: str = Field("2.0", description="Versión de JSON-RPC")
     method: str = Field(..., description="Método a ejecutar")
     params: Dict[str, Any] = Field(..., description="Parámetros del método")
@@ -75,6 +77,8 @@ class MCPExecuteRequest(BaseModel):
     """
     Modelo de solicitud de ejecución MCP
     """
+    model_config = ConfigDict(frozen=True)
+    
     tool: str = Field(..., description="Nombre de la herramienta a ejecutar")
     params: Dict[str, Any] = Field(..., description="Parámetros de la herramienta")
 
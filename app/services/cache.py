@@ -1,15 +1,55 @@
 import time
-from typing import Any, Optional, Dict
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Optional, Dict, List, Tuple
 from app.core.config import settings
 from app.core.exceptions import CacheError
 
+logger = logging.getLogger(__name__)
+
 class CacheService:
-    """Servicio de caché para MCP-Claude"""
+    """Servicio de caché LRU en memoria para MCP-Claude"""
     
     def __init__(self):
         """Inicializa el servicio de caché"""
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Cada entrada es (valor, expires_at); el orden refleja el uso reciente
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
         self._default_ttl = settings.CACHE_TTL
+        self._max_size = settings.CACHE_MAX_SIZE
+        self._sweep_interval = settings.CACHE_SWEEP_INTERVAL
+        self._sweeper: Optional[asyncio.Task] = None
+    
+    def _ensure_sweeper(self) -> None:
+        """Inicia la tarea de purga periódica si hay un event loop activo"""
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._sweeper = loop.create_task(self._sweep_loop())
+    
+    async def _sweep_loop(self) -> None:
+        """Purga periódicamente las entradas expiradas"""
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            purged = self.purge_expired()
+            if purged:
+                logger.debug(f"Caché en memoria: {purged} entradas expiradas purgadas")
+    
+    def purge_expired(self) -> int:
+        """
+        Elimina todas las entradas expiradas
+        
+        Returns:
+            Número de entradas eliminadas
+        """
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._cache.items() if now > expires_at]
+        for key in expired:
+            del self._cache[key]
+        return len(expired)
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -25,19 +65,21 @@ class CacheService:
             CacheError: Si hay un error al acceder a la caché
         """
         try:
-            if key not in self._cache:
+            cache_entry = self._cache.get(key)
+            if cache_entry is None:
                 return None
                 
-            cache_entry = self._cache[key]
-            if time.time() > cache_entry["expires_at"]:
+            value, expires_at = cache_entry
+            if time.monotonic() > expires_at:
                 del self._cache[key]
                 return None
                 
-            return cache_entry["value"]
+            self._cache.move_to_end(key)
+            return value
         except Exception as e:
             raise CacheError(f"Error al obtener valor de la caché: {str(e)}")
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
         Almacena un valor en la caché
         
@@ -46,45 +88,80 @@ class CacheService:
             value: Valor a almacenar
             ttl: Tiempo de vida en segundos (opcional)
             
-        Raises:
-            CacheError: Si hay un error al almacenar en la caché
+        Returns:
+            True si se almacenó el valor
         """
-        try:
-            expires_at = time.time() + (ttl if ttl is not None else self._default_ttl)
-            self._cache[key] = {
-                "value": value,
-                "expires_at": expires_at
-            }
-        except Exception as e:
-            raise CacheError(f"Error al almacenar valor en la caché: {str(e)}")
+        # Reloj monótono: no retrocede con ajustes NTP
+        self._cache[key] = (value, time.monotonic() + (ttl if ttl is not None else self._default_ttl))
+        self._cache.move_to_end(key)
+        
+        # Desalojar las entradas menos usadas recientemente
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+        
+        self._ensure_sweeper()
+        return True
     
-    def delete(self, key: str) -> None:
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
         """
-        Elimina un valor de la caché
+        Obtiene múltiples valores de la caché en una sola pasada
         
         Args:
-            key: Clave del valor a eliminar
+            keys: Lista de claves a obtener
             
-        Raises:
-            CacheError: Si hay un error al eliminar de la caché
+        Returns:
+            Diccionario con las claves encontradas y sus valores
         """
-        try:
-            if key in self._cache:
-                del self._cache[key]
-        except Exception as e:
-            raise CacheError(f"Error al eliminar valor de la caché: {str(e)}")
+        now = time.monotonic()
+        cache = self._cache
+        found = {}
+        for key in keys:
+            cache_entry = cache.get(key)
+            if cache_entry is None:
+                continue
+            value, expires_at = cache_entry
+            if now > expires_at:
+                del cache[key]
+                continue
+            cache.move_to_end(key)
+            found[key] = value
+        return found
     
-    def clear(self) -> None:
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
         """
-        Limpia toda la caché
+        Almacena múltiples valores en la caché con el mismo tiempo de vida
         
-        Raises:
-            CacheError: Si hay un error al limpiar la caché
+        Args:
+            mapping: Diccionario con claves y valores
+            ttl: Tiempo de vida en segundos (opcional)
+            
+        Returns:
+            True si se almacenaron los valores
         """
-        try:
-            self._cache.clear()
-        except Exception as e:
-            raise CacheError(f"Error al limpiar la caché: {str(e)}")
+        expires_at = time.monotonic() + (ttl if ttl is not None else self._default_ttl)
+        self._cache.update((key, (value, expires_at)) for key, value in mapping.items())
+        for key in mapping:
+            self._cache.move_to_end(key)
+        
+        # Desalojar las entradas menos usadas recientemente
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+        
+        self._ensure_sweeper()
+        return True
+    
+    def delete(self, key: str) -> None:
+        """
+        Elimina un valor de la caché
+        
+        Args:
+            key: Clave del valor a eliminar
+        """
+        self._cache.pop(key, None)
+    
+    def clear(self) -> None:
+        """Limpia toda la caché"""
+        self._cache.clear()
     
     def get_size(self) -> int:
         """
@@ -114,6 +191,7 @@ class CacheService:
         try:
             return {
                 "size": len(self._cache),
+                "max_size": self._max_size,
                 "default_ttl": self._default_ttl
             }
         except Exception as e:
@@ -10,7 +10,7 @@ from app.core.logging import LogManager
 from app.core.prompts import PromptTemplates
 from app.schemas.search import SearchAnalysis
 from app.core.markdown_logger import MarkdownLogger
-from app.core.claude_client import get_claude_client
+from app.core.claude_client import get_claude_client, RESPONSE_CACHE_TTL
 from app.core.cache import get_cache
 from app.core.metrics import MetricsCollector
 from app.schemas.claude import ClaudeRequest, ClaudeResponse, ClaudeAnalysis
@@ -23,7 +23,6 @@ class ClaudeService:
         self.logger = LogManager.get_logger("claude_service")
         self.client = get_claude_client()
         self._cache = get_cache()
-        self._cache_ttl = 3600  # 1 hora por defecto
         self._metrics = MetricsCollector()
         self.model = settings.CLAUDE_MODEL
         self.max_tokens = settings.CLAUDE_MAX_TOKENS
@@ -54,8 +53,7 @@ class ClaudeService:
                 prompt=request.text,
                 max_tokens=request.max_tokens,
                 temperature=request.temperature,
-                cache_enabled=True,
-                cache_ttl=self._cache_ttl
+                cache_enabled=True
             )
             
             # Registrar métricas
@@ -167,7 +165,7 @@ class ClaudeService:
                 "max_tokens": self.client.max_tokens,
                 "temperature": self.client.temperature,
                 "cache_enabled": True,
-                "cache_ttl": self._cache_ttl
+                "cache_ttl": RESPONSE_CACHE_TTL
             }
             
             return status
@@ -17,10 +17,13 @@ from app.services.filesystem_service import FileSystemService
 from app.services.claude_service import ClaudeService
 from app.services.cache import CacheService
 from app.core.logging import LogManager
-from app.core.cache import cache
+from app.core.cache import cache, generate_key
 
 logger = logging.getLogger(__name__)
 
+# Tiempo (segundos) durante el que se reutiliza el estado en memoria
+_STATUS_MEMO_TTL = 1.0
+
 class MCPService:
     """
     Servicio principal para el protocolo MCP
@@ -36,6 +39,8 @@ class MCPService:
         self.operations: List[MCPOperation] = []
         self._rate_limit_cache: Dict[str, Dict[str, int]] = {}
         self._last_cleanup = time.time()
+        self._status: Optional[MCPStatus] = None
+        self._status_expires_at = 0.0
         LogManager.log_info("mcp", "Servicio MCP inicializado")
         
     async def get_status(self) -> MCPStatus:
@@ -45,13 +50,20 @@ class MCPService:
         Returns:
             Estado del protocolo MCP
         """
+        # Reutilizar el estado reciente para no amplificar ráfagas de sondeos
+        now = time.monotonic()
+        if self._status is not None and now < self._status_expires_at:
+            return self._status
+        
         # Intentar obtener del caché
         cache_key = "mcp:status"
-        cached_status = cache.get(cache_key)
+        cached_status = await cache.get(cache_key)
         
         if cached_status:
             LogManager.log_info("mcp", "Estado MCP obtenido del caché")
-            return MCPStatus(**cached_status)
+            self._status = MCPStatus(**cached_status)
+            self._status_expires_at = now + _STATUS_MEMO_TTL
+            return self._status
         
         # Si no está en caché, crear nuevo estado
         status = MCPStatus(
@@ -128,8 +140,10 @@ class MCPService:
         )
         
         # Guardar en caché por 5 minutos
-        cache.set(cache_key, status.dict(), expire=300)
+        await cache.set(cache_key, status.model_dump(), ttl=300)
         
+        self._status = status
+        self._status_expires_at = now + _STATUS_MEMO_TTL
         return status
     
     def _check_rate_limit(self, request: MCPRequest) -> bool:
@@ -193,7 +207,7 @@ class MCPService:
             return MCPError(code=400, message="El campo 'params' es requerido")
         
         # Verificar tamaño de la solicitud
-        request_size = len(json.dumps(request.dict()).encode())
+        request_size = len(request.model_dump_json().encode())
         if request_size > mcp_config.max_request_size:
             return MCPError(
                 code=413, 
@@ -306,10 +320,10 @@ class MCPService:
             if resource_name not in mcp_resources:
                 raise ValueError(f"Recurso requerido no encontrado: {resource_name}")
         
-        # Verificar caché
+        # Verificar caché (CacheService es síncrono, sin await)
         if tool_config.cache_enabled:
-            cache_key = f"tool:{tool_name}:{json.dumps(params, sort_keys=True)}"
-            cached_result = await self.cache_service.get(cache_key)
+            cache_key = generate_key(f"tool:{tool_name}", params)
+            cached_result = self.cache_service.get(cache_key)
             if cached_result:
                 return cached_result
         
@@ -330,9 +344,9 @@ class MCPService:
         
         # Guardar en caché
         if tool_config.cache_enabled and result:
-            cache_key = f"tool:{tool_name}:{json.dumps(params, sort_keys=True)}"
+            cache_key = generate_key(f"tool:{tool_name}", params)
             cache_ttl = tool_config.cache_ttl or mcp_config.cache_ttl
-            await self.cache_service.set(cache_key, result, cache_ttl)
+            self.cache_service.set(cache_key, result, cache_ttl)
         
         return result
     
@@ -1,6 +1,7 @@
 import time
-import json
 import os
+import tempfile
+import orjson
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -96,12 +97,34 @@ class MetricsService:
     
     def _save_metrics(self):
         """Guarda las métricas actuales en un archivo"""
+        # Serializar una sola vez y reutilizar el resultado en ambos archivos
+        payload = orjson.dumps(self.current_metrics, option=orjson.OPT_INDENT_2)
+        
         metrics_file = os.path.join(self.metrics_dir, "current_metrics.json")
-        with open(metrics_file, "w") as f:
-            json.dump(self.current_metrics, f, indent=2)
+        self._write_atomic(metrics_file, payload)
         
         # Guardar un historial de métricas
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         history_file = os.path.join(self.metrics_dir, f"metrics_{timestamp}.json")
-        with open(history_file, "w") as f:
-            json.dump(self.current_metrics, f, indent=2) 
\ No newline at end of file
+        self._write_atomic(history_file, payload)
+    
+    def _write_atomic(self, path: str, payload: bytes):
+        """
+        Escribe un archivo de forma atómica
+        
+        Se escribe en un archivo temporal con nombre único dentro del mismo
+        directorio y se renombra con os.replace, de modo que un lector nunca ve
+        un archivo a medio escribir y varios workers no comparten el temporal.
+        
+        Args:
+            path: Ruta del archivo destino
+            payload: Contenido a escribir
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.metrics_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
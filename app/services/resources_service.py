@@ -333,16 +333,17 @@ class ResourcesService:
         value = request.parameters.get("value")
         ttl = request.parameters.get("ttl", 3600)
         
+        # CacheService es síncrono (memoria local): se invoca sin await
         if request.action == ResourceAccess.READ:
-            result = await self.cache_service.get(key)
+            result = self.cache_service.get(key)
             return ResourceResponse(
                 success=result is not None,
                 data=result
             )
         elif request.action == ResourceAccess.WRITE:
-            result = await self.cache_service.set(key, value, ttl)
+            self.cache_service.set(key, value, ttl)
             return ResourceResponse(
-                success=result,
+                success=True,
                 data={"key": key, "ttl": ttl}
             )
         
@@ -0,0 +1,175 @@
+import asyncio
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.core.cache import cached, generate_key
+
+def test_generate_key_is_order_independent():
+    """Test que verifica que la clave no depende del orden de los campos"""
+    key1 = generate_key("tool:test", {"a": 1, "b": [1, 2]})
+    key2 = generate_key("tool:test", {"b": [1, 2], "a": 1})
+    assert key1 == key2
+    assert key1.startswith("tool:test:")
+    assert generate_key("tool:test", {"a": 2}) != key1
+
+def test_generate_key_is_stable_across_hash_seeds():
+    """Test que verifica que los sets generan la misma clave en distintos procesos"""
+    code = (
+        "from app.core.cache import generate_key; "
+        "print(generate_key('tool:x', {'tags': {'alpha', 'beta', 'gamma', 'delta'}}))"
+    )
+    keys = set()
+    for seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+        )
+        keys.add(result.stdout.strip().splitlines()[-1])
+    
+    assert len(keys) == 1
+    assert keys == {generate_key("tool:x", {"tags": ["alpha", "beta", "delta", "gamma"]})}
+
+def test_cached_key_normalizes_arguments():
+    """Test que verifica que argumentos posicionales, nombrados y por defecto comparten clave"""
+    @cached(ttl=60)
+    async def func(a, b=2, *, c=3):
+        return a + b + c
+    
+    make_key = func._cache_keyfn
+    key = make_key((1,), {})
+    assert make_key((1, 2), {}) == key
+    assert make_key((), {"a": 1, "b": 2, "c": 3}) == key
+    assert make_key((1, 5), {}) != key
+
+def test_cached_key_includes_receiver():
+    """Test que verifica que el receptor forma parte de la clave por defecto"""
+    class Service:
+        def __init__(self, name):
+            self.name = name
+        
+        @cached()
+        async def method(self, value):
+            return value
+    
+    make_key = Service.method._cache_keyfn
+    # Un receptor no serializable impide cachear la llamada
+    with pytest.raises(TypeError):
+        make_key((Service("a"), 1), {})
+    
+    # Instancias con distinto estado no comparten entradas
+    assert make_key(({"name": "a"}, 1), {}) != make_key(({"name": "b"}, 1), {})
+
+def test_cached_key_ignore_receiver():
+    """Test que verifica que ignore_receiver excluye la instancia de la clave"""
+    class Service:
+        @cached(ignore_receiver=True)
+        async def method(self, value):
+            return value
+    
+    make_key = Service.method._cache_keyfn
+    assert make_key((Service(), 1), {}) == make_key((Service(),), {"value": 1})
+
+@pytest.mark.asyncio
+async def test_cached_unserializable_receiver_skips_cache():
+    """Test que verifica que un receptor no serializable se ejecuta sin caché"""
+    backend = AsyncMock()
+    
+    class Service:
+        @cached()
+        async def method(self, value):
+            return value
+    
+    with patch("app.core.cache.get_cache", return_value=backend):
+        assert await Service().method(1) == 1
+    
+    backend.get.assert_not_awaited()
+    backend.set.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_cached_hit_and_miss():
+    """Test que verifica que el resultado se almacena y se reutiliza"""
+    backend = AsyncMock()
+    backend.get.return_value = None
+    calls = []
+    
+    @cached(ttl=60)
+    async def func(value):
+        calls.append(value)
+        return {"value": value}
+    
+    with patch("app.core.cache.get_cache", return_value=backend):
+        assert await func(1) == {"value": 1}
+        backend.set.assert_awaited_once()
+        assert backend.set.call_args.kwargs["ttl"] == 60
+        
+        backend.get.return_value = {"value": 1}
+        assert await func(1) == {"value": 1}
+    
+    assert calls == [1]
+
+@pytest.mark.asyncio
+async def test_cached_coalesces_concurrent_misses():
+    """Test que verifica que llamadas concurrentes ejecutan la función una sola vez"""
+    backend = AsyncMock()
+    backend.get.return_value = None
+    calls = []
+    
+    @cached(ttl=60)
+    async def func(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return {"value": value}
+    
+    with patch("app.core.cache.get_cache", return_value=backend):
+        results = await asyncio.gather(*(func(1) for _ in range(5)))
+    
+    assert results == [{"value": 1}] * 5
+    assert calls == [1]
+    backend.set.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_cached_propagates_errors_to_waiters():
+    """Test que verifica que un error se propaga a todas las llamadas en espera"""
+    backend = AsyncMock()
+    backend.get.return_value = None
+    
+    @cached()
+    async def func(value):
+        await asyncio.sleep(0.01)
+        raise ValueError("fallo")
+    
+    with patch("app.core.cache.get_cache", return_value=backend):
+        results = await asyncio.gather(func(1), func(1), return_exceptions=True)
+    
+    assert all(isinstance(result, ValueError) for result in results)
+    backend.set.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_cached_waiters_survive_leader_cancellation():
+    """Test que verifica que cancelar la carga en curso no cancela a quienes esperan"""
+    backend = AsyncMock()
+    backend.get.return_value = None
+    calls = []
+    
+    @cached()
+    async def func(value):
+        calls.append(value)
+        await asyncio.sleep(0.05)
+        return {"value": value}
+    
+    with patch("app.core.cache.get_cache", return_value=backend):
+        leader = asyncio.create_task(func(1))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(func(1))
+        await asyncio.sleep(0.01)
+        
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        
+        assert await follower == {"value": 1}
+    
+    assert calls == [1, 1]
+    backend.set.assert_awaited_once()
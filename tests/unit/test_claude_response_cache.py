@@ -0,0 +1,28 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.core.claude_client import ClaudeClient, RESPONSE_CACHE_TTL
+from app.core.config import settings
+
+@pytest.mark.asyncio
+async def test_claude_client_caches_responses(monkeypatch):
+    """Test que verifica que las respuestas de Claude se cachean con cached"""
+    monkeypatch.setattr(settings, "CLAUDE_API_KEY", "test-key")
+    client = ClaudeClient()
+    response = MagicMock()
+    response.json.return_value = {"content": [{"text": "hola"}], "usage": {"total_tokens": 3}}
+    client.http_client = MagicMock()
+    client.http_client.post.return_value = response
+    backend = AsyncMock()
+    backend.get.return_value = None
+    
+    with patch("app.core.cache.get_cache", return_value=backend):
+        result = await client.generate_response("prompt")
+        assert result["content"] == "hola"
+        
+        backend.get.return_value = result
+        assert await client.generate_response("prompt") == result
+    
+    client.http_client.post.assert_called_once()
+    key = backend.set.call_args.args[0]
+    assert key.startswith("claude:response:")
+    assert backend.set.call_args.kwargs["ttl"] == RESPONSE_CACHE_TTL
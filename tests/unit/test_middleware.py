@@ -0,0 +1,94 @@
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.cache import CacheOperationError
+from app.core.config import settings
+from app.middleware import unified_middleware
+
+@pytest.fixture
+def client():
+    """Cliente de prueba con el middleware unificado registrado"""
+    app = FastAPI()
+    app.middleware("http")(unified_middleware)
+
+    @app.get("/")
+    async def root():
+        return {"message": "Hello World"}
+
+    @app.get("/api/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/health/")
+    async def health_router():
+        return {"status": "ok"}
+
+    @app.get("/mcp/status")
+    async def mcp_status():
+        return {"status": "online"}
+
+    return TestClient(app)
+
+@pytest.fixture
+def mock_cache():
+    with patch("app.middleware.rate_limit.cache") as mock:
+        mock.get_or_set = AsyncMock(return_value={"count": 0, "reset_time": int(time.time()) + 60})
+        mock.set = AsyncMock(return_value=True)
+        yield mock
+
+def auth_headers():
+    return {"Authorization": f"Bearer {settings.API_KEY}"}
+
+def test_missing_authorization_returns_401(client, mock_cache):
+    """Test que verifica el 401 sin encabezado de autorización"""
+    response = client.get("/")
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    mock_cache.get_or_set.assert_not_called()
+
+def test_malformed_authorization_returns_401(client, mock_cache):
+    """Test que verifica el 401 con un encabezado mal formado"""
+    response = client.get("/", headers={"Authorization": "Token abc"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Formato de autorización inválido"
+
+def test_authorized_request(client, mock_cache):
+    """Test que verifica una solicitud autenticada dentro del límite"""
+    response = client.get("/", headers=auth_headers())
+    assert response.status_code == 200
+    assert response.json() == {"message": "Hello World"}
+    mock_cache.set.assert_awaited_once()
+
+def test_rate_limit_exceeded_returns_429(client, mock_cache):
+    """Test que verifica el 429 al superar el límite de solicitudes"""
+    mock_cache.get_or_set.return_value = {
+        "count": settings.RATE_LIMIT_MAX_REQUESTS,
+        "reset_time": int(time.time()) + 60
+    }
+
+    response = client.get("/", headers=auth_headers())
+    assert response.status_code == 429
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+    assert "Retry-After" in response.headers
+
+def test_public_path_skips_auth_and_rate_limit(client, mock_cache):
+    """Test que verifica que las rutas públicas no requieren auth ni rate limit"""
+    response = client.get("/api/health")
+    assert response.status_code == 200
+    mock_cache.get_or_set.assert_not_called()
+
+@pytest.mark.parametrize("path", ["/health/", "/mcp/status"])
+def test_health_routes_skip_auth_and_rate_limit(client, mock_cache, path):
+    """Test que verifica que las rutas de sondeo servidas no requieren auth"""
+    response = client.get(path)
+    assert response.status_code == 200
+    mock_cache.get_or_set.assert_not_called()
+
+def test_rate_limit_without_cache(client, mock_cache):
+    """Test que verifica que un fallo de Redis no bloquea las solicitudes"""
+    mock_cache.get_or_set.side_effect = CacheOperationError("Redis no disponible")
+
+    response = client.get("/", headers=auth_headers())
+    assert response.status_code == 200
@@ -0,0 +1,366 @@
+import json
+import time
+import asyncio
+import orjson
+import pytest
+import pytest_asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from redis.exceptions import ConnectionError as RedisConnectionError
+from fakeredis import FakeAsyncRedis
+from fastapi import HTTPException
+from pydantic import BaseModel
+from redis import asyncio as aioredis
+from app.core.cache import Cache, CacheConnectionError, generate_key, _default_serializer
+from app.core.blacklist import TokenBlacklist
+from app.middleware.rate_limit import RateLimiter
+
+class Item(BaseModel):
+    name: str
+    count: int
+
+@pytest.fixture
+def cache():
+    """Fixture para el caché de Redis (sin conexión)"""
+    return Cache()
+
+@pytest.fixture
+def redis_cache():
+    """Fixture para el caché sobre un Redis en memoria (fakeredis con Lua)"""
+    return Cache(client=FakeAsyncRedis(decode_responses=True))
+
+def test_default_serializer_types():
+    """Test que verifica la conversión de tipos no soportados por orjson"""
+    assert sorted(_default_serializer({3, 1, 2})) == [1, 2, 3]
+    assert _default_serializer(frozenset({"a"})) == ["a"]
+    assert _default_serializer(timedelta(minutes=1)) == 60.0
+    assert _default_serializer(Item(name="a", count=1)) == {"name": "a", "count": 1}
+
+    with pytest.raises(TypeError):
+        _default_serializer(object())
+
+def test_dumps_roundtrip(cache):
+    """Test que verifica que los valores se serializan y deserializan"""
+    value = {"tags": {"a"}, "ttl": timedelta(seconds=5), "item": Item(name="a", count=1)}
+    assert cache._loads(cache._dumps(value)) == {
+        "tags": ["a"],
+        "ttl": 5.0,
+        "item": {"name": "a", "count": 1}
+    }
+
+def test_dumps_non_str_keys(cache):
+    """Test que verifica que las claves no str se convierten como en json.dumps"""
+    value = {1: "a", None: "b", 1.5: "c"}
+    assert cache._loads(cache._dumps(value)) == json.loads(json.dumps(value))
+
+def test_generate_key_non_str_keys():
+    """Test que verifica que generate_key acepta claves no str"""
+    assert generate_key("test", {1: "a"}) == generate_key("test", {"1": "a"})
+
+def test_loads_json_fallback(cache):
+    """Test que verifica la lectura de claves antiguas escritas con json"""
+    legacy = json.dumps({"value": float("nan")})
+
+    cache._json_fallback = True
+    value = cache._loads(legacy)
+    assert value["value"] != value["value"]
+
+    cache._json_fallback = False
+    with pytest.raises(orjson.JSONDecodeError):
+        cache._loads(legacy)
+
+@pytest.mark.asyncio
+async def test_ping(redis_cache):
+    """Test que verifica la comprobación explícita de la conexión"""
+    assert await redis_cache.ping() is True
+
+@pytest.mark.asyncio
+async def test_ping_connection_error():
+    """Test que verifica el error cuando Redis no está disponible"""
+    unreachable = Cache(client=aioredis.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1))
+
+    with pytest.raises(CacheConnectionError):
+        await unreachable.ping()
+
+@pytest.mark.asyncio
+async def test_get_or_set_stores_missing_value(redis_cache):
+    """Test que verifica que get_or_set almacena el valor si no existe"""
+    assert await redis_cache.get_or_set("key", {"count": 0}, ttl=30) == {"count": 0}
+    assert await redis_cache.get("key") == {"count": 0}
+
+    ttl = await redis_cache.get_ttl("key")
+    assert 0 < ttl <= 30
+
+@pytest.mark.asyncio
+async def test_get_or_set_returns_existing_value(redis_cache):
+    """Test que verifica que get_or_set no sobrescribe un valor existente"""
+    await redis_cache.set("key", {"count": 5}, ttl=100)
+
+    assert await redis_cache.get_or_set("key", {"count": 0}, ttl=30) == {"count": 5}
+    assert await redis_cache.get_ttl("key") > 30
+
+@pytest.mark.asyncio
+async def test_get_or_set_default_ttl(redis_cache):
+    """Test que verifica que get_or_set usa el TTL por defecto"""
+    await redis_cache.get_or_set("key", 1)
+    assert 0 < await redis_cache.get_ttl("key") <= redis_cache.default_ttl
+
+@pytest.mark.asyncio
+async def test_get_or_set_without_expiry(redis_cache):
+    """Test que verifica que sin TTL el valor se almacena sin expiración"""
+    redis_cache.default_ttl = 0
+
+    await redis_cache.get_or_set("key", 1)
+    assert await redis_cache.redis.ttl(f"{redis_cache.prefix}key") == -1
+
+def make_request(path="/api/test"):
+    request = MagicMock()
+    request.headers = {}
+    request.client.host = "127.0.0.1"
+    request.url.path = path
+    return request
+
+@pytest.mark.asyncio
+async def test_rate_limiter_counts_requests(redis_cache):
+    """Test que verifica que el rate limiter cuenta solicitudes y devuelve 429"""
+    limiter = RateLimiter()
+    limiter.max_requests = 2
+
+    with patch("app.middleware.rate_limit.cache", redis_cache):
+        await limiter.check_rate_limit(make_request())
+        await limiter.check_rate_limit(make_request())
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.check_rate_limit(make_request())
+
+    assert exc_info.value.status_code == 429
+    window = await redis_cache.get(limiter._get_cache_key("127.0.0.1", "/api/test"))
+    assert window["count"] == 3
+    assert window["reset_time"] > time.time()
+
+@pytest.mark.asyncio
+async def test_set_many_with_ttl(redis_cache):
+    """Test que verifica que set_many aplica el TTL a todas las claves"""
+    assert await redis_cache.set_many({"a": 1, "b": {"x": [1, 2]}}, ttl=30) is True
+
+    assert await redis_cache.get_many(["a", "b", "c"]) == {"a": 1, "b": {"x": [1, 2]}}
+    for key in ("a", "b"):
+        assert 0 < await redis_cache.get_ttl(key) <= 30
+
+@pytest.mark.asyncio
+async def test_set_many_default_ttl(redis_cache):
+    """Test que verifica que set_many usa el TTL por defecto"""
+    assert await redis_cache.set_many({"a": 1}) is True
+    assert 0 < await redis_cache.get_ttl("a") <= redis_cache.default_ttl
+
+@pytest.mark.asyncio
+async def test_set_many_without_expiry_uses_mset(redis_cache):
+    """Test que verifica que sin TTL se usa un único MSET"""
+    redis_cache.default_ttl = 0
+    redis_cache._set_many_script = MagicMock()
+
+    assert await redis_cache.set_many({"a": 1, "b": 2}) is True
+
+    redis_cache._set_many_script.assert_not_called()
+    assert await redis_cache.get_many(["a", "b"]) == {"a": 1, "b": 2}
+    assert await redis_cache.redis.ttl(f"{redis_cache.prefix}a") == -1
+
+@pytest.mark.asyncio
+async def test_set_many_empty(redis_cache):
+    """Test que verifica que un mapping vacío no llega a Redis"""
+    assert await redis_cache.set_many({}) is True
+    assert await redis_cache.redis.dbsize() == 0
+
+@pytest.mark.asyncio
+async def test_scan_iter_streams_unprefixed_batches(redis_cache):
+    """Test que verifica que scan_iter devuelve lotes de claves sin el prefijo"""
+    await redis_cache.set_many({f"blacklist:t{i}": True for i in range(12)})
+    await redis_cache.set("other", 1)
+    await redis_cache.redis.set("foreign:blacklist:x", 1)
+
+    batches = [batch async for batch in redis_cache.scan_iter("blacklist:*", count=5)]
+
+    assert len(batches) > 1
+    assert sorted(key for batch in batches for key in batch) == sorted(
+        f"blacklist:t{i}" for i in range(12)
+    )
+
+@pytest.mark.asyncio
+async def test_clear_only_unlinks_prefixed_keys(redis_cache):
+    """Test que verifica que clear solo elimina las claves del prefijo del caché"""
+    await redis_cache.set_many({f"key{i}": i for i in range(1200)})
+    await redis_cache.redis.set("foreign:key", 1)
+
+    assert await redis_cache.clear() is True
+
+    assert await redis_cache.redis.keys("*") == ["foreign:key"]
+
+@pytest.mark.asyncio
+async def test_blacklist_cleanup_removes_keys_without_ttl(redis_cache):
+    """Test que verifica que la limpieza de la blacklist recorre las claves por lotes"""
+    blacklist = TokenBlacklist()
+    blacklist._cache = redis_cache
+    blacklist._batch_size = 2
+    blacklist._last_cleanup = 0
+
+    await redis_cache.set_many({f"blacklist:t{i}": True for i in range(5)}, ttl=60)
+    await redis_cache.redis.set(f"{redis_cache.prefix}blacklist:stale", "true")
+
+    await blacklist._cleanup_expired()
+
+    assert await redis_cache.exists("blacklist:stale") is False
+    assert len(await redis_cache.get_many([f"blacklist:t{i}" for i in range(5)])) == 5
+
+class StubConnection:
+    """Conexión simulada para el client tracking"""
+    
+    def __init__(self, *responses, fail=False):
+        self.responses = asyncio.Queue()
+        for response in responses:
+            self.responses.put_nowait(response)
+        self.fail = fail
+        self.sent = []
+        self.disconnected = False
+    
+    async def connect(self):
+        if self.fail:
+            raise RedisConnectionError("CLIENT no permitido")
+    
+    async def send_command(self, *args):
+        self.sent.append(args)
+    
+    async def read_response(self):
+        response = await self.responses.get()
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    async def disconnect(self):
+        self.disconnected = True
+
+@pytest_asyncio.fixture
+async def tracking_cache(redis_cache):
+    """Caché con client tracking habilitado para las claves de blacklist"""
+    redis_cache._tracking_enabled = True
+    redis_cache._local_prefixes = (f"{redis_cache.prefix}blacklist:",)
+    yield redis_cache
+    if redis_cache._tracking_task is not None:
+        redis_cache._tracking_task.cancel()
+        await asyncio.gather(redis_cache._tracking_task, return_exceptions=True)
+
+def count_gets(cache):
+    calls = []
+    original = cache.redis.get
+    
+    async def get(key):
+        calls.append(key)
+        return await original(key)
+    
+    cache.redis.get = get
+    return calls
+
+def test_tracking_listener_without_socket_timeout():
+    """Test que verifica que el listener de invalidaciones no expira por inactividad"""
+    cache = Cache()
+    assert cache._tracking_connection(socket_timeout=None).socket_timeout is None
+    assert cache._tracking_connection().socket_timeout == cache.pool.connection_kwargs["socket_timeout"]
+
+@pytest.mark.asyncio
+async def test_tracking_local_cache(tracking_cache):
+    """Test que verifica el caché local, las invalidaciones y las escrituras propias"""
+    listener = StubConnection(7, ["subscribe", "__redis__:invalidate", 1])
+    tracker = StubConnection("OK")
+    tracking_cache._tracking_connection = MagicMock(side_effect=[listener, tracker])
+    prefix = tracking_cache.prefix
+    await tracking_cache.set("blacklist:a", True)
+    gets = count_gets(tracking_cache)
+    
+    # Los aciertos y las ausencias se sirven localmente tras la primera lectura
+    assert await tracking_cache.get("blacklist:a") is True
+    assert await tracking_cache.get("blacklist:a") is True
+    assert await tracking_cache.get("blacklist:b") is None
+    assert await tracking_cache.get("blacklist:b") is None
+    assert len(gets) == 2
+    assert tracker.sent == [(
+        "CLIENT", "TRACKING", "ON", "REDIRECT", 7, "BCAST", "PREFIX", f"{prefix}blacklist:"
+    )]
+    
+    # Una invalidación de Redis descarta la entrada local
+    await tracking_cache.redis.set(f"{prefix}blacklist:b", "1")
+    await listener.responses.put(["message", "__redis__:invalidate", [f"{prefix}blacklist:b"]])
+    await asyncio.sleep(0)
+    assert await tracking_cache.get("blacklist:b") == 1
+    assert len(gets) == 3
+    
+    # Las escrituras propias descartan la entrada sin esperar la invalidación
+    await tracking_cache.delete("blacklist:a")
+    assert await tracking_cache.get("blacklist:a") is None
+    assert len(gets) == 4
+    
+    # Las claves fuera de los prefijos locales siempre van a Redis
+    await tracking_cache.get("other")
+    await tracking_cache.get("other")
+    assert len(gets) == 6
+
+@pytest.mark.asyncio
+async def test_tracking_skips_values_invalidated_during_read(tracking_cache):
+    """Test que verifica que no se guarda un valor invalidado durante la lectura"""
+    listener = StubConnection(7, ["subscribe", "__redis__:invalidate", 1])
+    tracking_cache._tracking_connection = MagicMock(side_effect=[listener, StubConnection("OK")])
+    full_key = f"{tracking_cache.prefix}blacklist:a"
+    original = tracking_cache.redis.get
+    
+    async def racing_get(key):
+        value = await original(key)
+        await listener.responses.put(["message", "__redis__:invalidate", [full_key]])
+        await asyncio.sleep(0)
+        return value
+    
+    tracking_cache.redis.get = racing_get
+    assert await tracking_cache.get("blacklist:a") is None
+    assert full_key not in tracking_cache._local
+
+@pytest.mark.asyncio
+async def test_tracking_failure_is_not_retried_on_every_read(tracking_cache):
+    """Test que verifica que un fallo al activar el tracking no se reintenta en cada lectura"""
+    tracking_cache._tracking_connection = MagicMock(
+        side_effect=lambda **kwargs: StubConnection(fail=True)
+    )
+    gets = count_gets(tracking_cache)
+    
+    assert await tracking_cache.get("blacklist:a") is None
+    assert await tracking_cache.get("blacklist:a") is None
+    
+    assert tracking_cache._tracking_connection.call_count == 2
+    assert len(gets) == 2
+    assert not tracking_cache._local
+    
+    # Pasado el intervalo se vuelve a intentar
+    tracking_cache._tracking_retry_at = 0.0
+    await tracking_cache.get("blacklist:a")
+    assert tracking_cache._tracking_connection.call_count == 4
+
+@pytest.mark.asyncio
+async def test_tracking_listener_drop_clears_local_cache(tracking_cache):
+    """Test que verifica que al perder el listener se vacía el caché local"""
+    listener = StubConnection(7, ["subscribe", "__redis__:invalidate", 1])
+    tracker = StubConnection("OK")
+    tracking_cache._tracking_connection = MagicMock(side_effect=[listener, tracker])
+    
+    await tracking_cache.get("blacklist:a")
+    assert tracking_cache._local
+    
+    await listener.responses.put(RedisConnectionError("conexión cerrada"))
+    await tracking_cache._tracking_task
+    
+    assert not tracking_cache._local
+    assert listener.disconnected and tracker.disconnected
+    
+    # La siguiente lectura vuelve a activar el tracking
+    tracking_cache._tracking_connection = MagicMock(side_effect=[
+        StubConnection(8, ["subscribe", "__redis__:invalidate", 1]),
+        StubConnection("OK")
+    ])
+    await tracking_cache.get("blacklist:a")
+    assert tracking_cache._tracking_connection.call_count == 2
+    assert not tracking_cache._tracking_task.done()
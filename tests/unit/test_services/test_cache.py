@@ -93,16 +93,59 @@ class TestCacheService:
         assert stats["size"] == 2
         assert "default_ttl" in stats
     
-    def test_error_handling(self, cache_service):
-        """Prueba el manejo de errores"""
-        # Simular error al almacenar
-        with pytest.raises(CacheError) as exc_info:
-            cache_service.set(None, "value")
+    def test_lru_eviction(self, cache_service):
+        """Prueba el desalojo del elemento menos usado recientemente"""
+        cache_service._max_size = 2
+        cache_service.set("key1", "value1")
+        cache_service.set("key2", "value2")
+        
+        # Acceder a key1 la convierte en la más reciente
+        assert cache_service.get("key1") == "value1"
+        
+        # Al superar el tamaño máximo se desaloja key2
+        cache_service.set("key3", "value3")
+        assert cache_service.get_size() == 2
+        assert cache_service.get("key2") is None
+        assert cache_service.get("key1") == "value1"
+        assert cache_service.get("key3") == "value3"
+    
+    def test_purge_expired(self, cache_service):
+        """Prueba la purga de entradas expiradas"""
+        cache_service.set("key1", "value1", ttl=1)
+        cache_service.set("key2", "value2")
+        
+        time.sleep(1.1)
         
-        assert "Error al almacenar valor en la caché" in str(exc_info.value)
+        assert cache_service.purge_expired() == 1
+        assert cache_service.get_size() == 1
+        assert cache_service.get("key2") == "value2"
+    
+    def test_get_many_and_set_many(self, cache_service):
+        """Prueba almacenar y obtener múltiples valores"""
+        assert cache_service.set_many({"key1": "value1", "key2": "value2"}) is True
+        
+        # Las claves inexistentes no aparecen en el resultado
+        values = cache_service.get_many(["key1", "key2", "key3"])
+        assert values == {"key1": "value1", "key2": "value2"}
+    
+    def test_get_many_expired(self, cache_service):
+        """Prueba que get_many omite y elimina las entradas expiradas"""
+        cache_service.set_many({"key1": "value1"}, ttl=1)
+        cache_service.set("key2", "value2")
+        
+        time.sleep(1.1)
         
-        # Simular error al obtener
+        assert cache_service.get_many(["key1", "key2"]) == {"key2": "value2"}
+        assert cache_service.get_size() == 1
+    
+    def test_set_returns_true(self, cache_service):
+        """Prueba que almacenar un valor devuelve True"""
+        assert cache_service.set("test_key", "test_value") is True
+    
+    def test_error_handling(self, cache_service):
+        """Prueba el manejo de errores"""
+        # Simular error al obtener (clave no hashable)
         with pytest.raises(CacheError) as exc_info:
-            cache_service.get(None)
+            cache_service.get(["invalid"])
         
         assert "Error al obtener valor de la caché" in str(exc_info.value) 
\ No newline at end of file
@@ -118,4 +118,14 @@ class TestMetricsService:
         
         assert history["requests"] == 1
         assert history["tokens"] == 100
-        assert len(history["response_times"]) == 1 
\ No newline at end of file
+        assert len(history["response_times"]) == 1     
+    def test_write_atomic_leaves_no_temp_files(self, metrics_service, temp_metrics_dir):
+        """Prueba que la escritura atómica deja el contenido final sin temporales"""
+        path = os.path.join(temp_metrics_dir, "current_metrics.json")
+        metrics_service._write_atomic(path, b'{"requests": 1}')
+        metrics_service._write_atomic(path, b'{"requests": 2}')
+        
+        with open(path, "rb") as f:
+            assert f.read() == b'{"requests": 2}'
+        
+        assert not [f for f in os.listdir(temp_metrics_dir) if f.endswith(".tmp")]